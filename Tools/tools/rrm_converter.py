@@ -2,20 +2,40 @@
 """Small best-effort .rrm <-> .obj converter with Texture/UV support.
 """
 import argparse
+import mmap
 import os
+import re
 import struct
 import sys
 import shutil
 import math
-from math import isfinite
 from pathlib import Path
 
+import numpy as np
+
+try:
+    from PIL import Image
+except ImportError:  # without Pillow, DDS textures are copied instead of converted
+    Image = None
+
+# Precompiled formats: skip per-call format-string parsing
+_U32 = struct.Struct('<I')
+_OFFSETS = struct.Struct('<2I')  # index/vertex buffer offsets at 0xb0/0xb4
+
+# "v x y z" OBJ lines whose first three fields are plain numbers (as float() reads them)
+_OBJ_NUM = rb"([-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?|[-+]?(?i:nan|inf(?:inity)?))"
+_OBJ_VERTEX = re.compile(
+    rb"^v [^\S\n]*" + _OBJ_NUM + rb"[^\S\n]+" + _OBJ_NUM + rb"[^\S\n]+" + _OBJ_NUM + rb"(?=\s|$)",
+    re.MULTILINE,
+)
+
 def read_bytes(path):
+    """Map the file read-only so struct/NumPy views alias its pages without copying."""
     with open(path, "rb") as f:
-        return f.read()
-
-def is_valid_float(v):
-    return abs(v) < 1e7 and v == v
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return b""
 
 # --- Texture / MTL Helpers ---
 
@@ -27,14 +47,18 @@ def dds_to_png(dds_path, output_dir, stem):
     png_filename = f"{stem}.png"
     png_path = os.path.join(output_dir, png_filename)
     
-    # Try using PIL
-    try:
-        from PIL import Image
-        with Image.open(dds_path) as img:
-            img.save(png_path, "PNG")
+    # Already converted by an earlier run and still current: skip the re-encode
+    if os.path.exists(png_path) and os.path.getmtime(png_path) >= os.path.getmtime(dds_path):
         return png_filename
-    except Exception:
-        pass
+    
+    # Try using PIL
+    if Image is not None:
+        try:
+            with Image.open(dds_path) as img:
+                img.save(png_path, "PNG")
+            return png_filename
+        except Exception:
+            pass
 
     # Fallback: just copy as .dds if we can't convert
     # But user requested .png. We can try to rename or just copy dds.
@@ -76,10 +100,16 @@ illum 1"""
 
 # --- UV Extraction Logic ---
 
+def float_runs(arr):
+    """Runs of plausible floats as (start_word, count) arrays, via mask edges."""
+    valid = np.isfinite(arr) & (np.abs(arr) < 1e7)
+    edges = np.flatnonzero(np.diff(np.r_[False, valid, False].astype(np.int8)))
+    return edges[0::2], edges[1::2] - edges[0::2]
+
 def extract_uvs_from_rrm(data, vertex_count):
     """Extract UV coordinates from RRM file data."""
     try:
-        vert_off = struct.unpack_from("<I", data, 0xb4)[0]
+        vert_off = _U32.unpack_from(data, 0xb4)[0]
     except struct.error:
         return None
     
@@ -90,15 +120,17 @@ def extract_uvs_from_rrm(data, vertex_count):
         uv_offset_in_stride = 24
         if uv_off is None: return None
         if uv_off + stride * vertex_count > len(data): return None
-        uvs = []
-        for i in range(vertex_count):
-            try:
-                u = struct.unpack_from('<f', data, uv_off + i * stride + uv_offset_in_stride)[0]
-                v = struct.unpack_from('<f', data, uv_off + i * stride + uv_offset_in_stride + 4)[0]
-            except Exception: return None
-            if not (-10.0 < u < 10.0 and -10.0 < v < 10.0): return None
-            uvs.append((u, v))
-        return uvs
+        # (vertex_count, 8) float view; UV is the float pair at +24
+        arr = np.frombuffer(data, dtype='<f4', offset=uv_off, count=vertex_count * (stride // 4))
+        uvs = arr.reshape(vertex_count, stride // 4)[:, uv_offset_in_stride // 4:uv_offset_in_stride // 4 + 2]
+        if not ((-10.0 < uvs) & (uvs < 10.0)).all(): return None
+        return uvs.tolist()
+
+    def read_packed(start):
+        # stride 16, 4 floats per vertex; UV is the first float pair
+        if start + 16 * vertex_count > len(data): return None
+        arr = np.frombuffer(data, dtype='<f4', offset=start, count=vertex_count * 4)
+        return arr.reshape(vertex_count, 4)[:, :2].tolist()
 
     # 1. Try legacy stream at 0x20c0
     uvs = read_stream2(0x20c0)
@@ -110,125 +142,107 @@ def extract_uvs_from_rrm(data, vertex_count):
     # 3. Try packed UV run (stride 16)
     if uvs is None:
         # Scan for float runs
-        n = len(data)
-        off = 0
-        runs = []
-        while off <= n - 4:
-            try: val = struct.unpack_from('<f', data, off)[0]
-            except: break
-            if not is_valid_float(val):
-                off += 4; continue
-            start = off
-            count = 0
-            while off <= n - 4:
-                try: v = struct.unpack_from('<f', data, off)[0]
-                except: break
-                if not is_valid_float(v): break
-                count += 1
-                off += 4
-            if count >= vertex_count * 4:
-                runs.append((start, count))
-            # skip ahead? no, loop increments
+        arr = np.frombuffer(data, dtype='<f4', count=len(data) // 4)
+        starts, counts = float_runs(arr)
+        long_enough = counts >= vertex_count * 4
+        starts, counts = starts[long_enough], counts[long_enough]
         
-        # Check candidates
-        candidates = []
-        for start, count in runs:
-             vals = [struct.unpack_from('<f', data, start + i * 4)[0] for i in range(min(count, 40))]
-             rng = max(abs(v) for v in vals) if vals else 0
-             if rng < 5.0: candidates.append((start, count, rng))
+        # Check candidates: max |value| over each run's first (up to) 40
+        # floats, gathered for all runs at once; short runs repeat their last
+        rows = starts[:, None] + np.minimum(np.arange(40), counts[:, None] - 1)
+        rng = np.abs(arr[rows]).max(axis=1)
+        uv_like = rng < 5.0
         
-        if candidates:
-            candidates.sort(key=lambda t: (t[2], t[0]))
-            run_start = candidates[0][0]
-            try:
-                uvs = []
-                for i in range(vertex_count):
-                    u = struct.unpack_from('<f', data, run_start + i * 16)[0]
-                    v = struct.unpack_from('<f', data, run_start + i * 16 + 4)[0]
-                    uvs.append((u, v))
-            except: uvs = None
+        if uv_like.any():
+            # lowest range first, then earliest start
+            best = np.lexsort((starts[uv_like], rng[uv_like]))[0]
+            run_start = int(starts[uv_like][best]) * 4
+            uvs = read_packed(run_start)
 
     # 4. Fallback 0x31c0
     if uvs is None:
-        try:
-            uvs = []
-            for i in range(vertex_count):
-                u = struct.unpack_from('<f', data, 0x31c0 + i * 16)[0]
-                v = struct.unpack_from('<f', data, 0x31c0 + i * 16 + 4)[0]
-                uvs.append((u, v))
-        except: uvs = None
+        uvs = read_packed(0x31c0)
 
     return uvs
 
+# --- Mesh Extraction ---
+
+def dedup_vertices(V, eps=1e-6):
+    """Merge positions that fall in the same eps grid cell.
+    
+    Returns (V_dedup, remap): unique rows of V in first-occurrence order and,
+    per input row, its index into V_dedup. Non-finite rows are never merged.
+    """
+    with np.errstate(invalid="ignore", over="ignore"):
+        V64 = np.asarray(V, dtype=np.float64)  # signalling NaNs warn on the cast
+        q = np.round(V64 / eps)
+    small = np.abs(q) < 2.0**62  # False for NaN/inf and values too big for int64
+    # Quantized cells where they fit, raw float bits (exact match) otherwise,
+    # plus a column recording which coordinates hold bits
+    bits = np.ascontiguousarray(V, dtype="<f4").view("<i4")
+    keys = np.empty((len(V64), 4), dtype=np.int64)
+    cells = keys[:, :3]
+    cells[:] = bits
+    cells[small] = q[small]
+    keys[:, 3] = (~small) @ np.array([1, 2, 4])
+    nonfinite = np.flatnonzero(~np.isfinite(V64).all(axis=1))
+    keys[nonfinite, 3] = -1 - nonfinite
+    
+    _, first, inv = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    # np.unique sorts by key; renumber groups by first occurrence instead
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return V[first[order]], rank[inv.reshape(-1)]
+
+def format_rows(template, rows):
+    """Format every row of a 2D array with one %-operation on a repeated template."""
+    rows = np.asarray(rows)
+    return (template * len(rows)) % tuple(rows.ravel().tolist())
+
 def auto_extract_rrm(in_path, out_path):
     """Extract mesh from .rrm file using header offsets + UVs + Texture handling."""
     data = read_bytes(in_path)
     
     # Header offsets
     try:
-        idx_off = struct.unpack_from("<I", data, 0xb0)[0]
-        vert_off = struct.unpack_from("<I", data, 0xb4)[0]
+        idx_off, vert_off = _OFFSETS.unpack_from(data, 0xb0)
     except struct.error:
         raise RuntimeError("Failed to read header offsets (0xb0/0xb4)")
     
-    # Indices
-    idx_vals = []
-    off = idx_off
-    while off < len(data) - 3:
-        try:
-            val = struct.unpack_from("<I", data, off)[0]
-            if val > 100000: break
-            idx_vals.append(val)
-            off += 4
-        except struct.error: break
-    
-    if len(idx_vals) % 3 != 0:
-        idx_vals = idx_vals[:((len(idx_vals) // 3) * 3)]
+    # Indices: decode the tail in one view, cut at the first value > 100000
+    n_words = max(0, (len(data) - idx_off) // 4)
+    idx = np.frombuffer(data, dtype='<u4', offset=min(idx_off, len(data)), count=n_words)
+    bad = idx > 100000
+    cutoff = int(bad.argmax()) if bad.any() else idx.size
+    idx_vals = idx[:cutoff - (cutoff % 3)]
     
-    if not idx_vals:
+    if idx_vals.size == 0:
         raise RuntimeError("No index data found")
     
-    max_index = max(idx_vals)
+    max_index = int(idx_vals.max())
     required_vcount = max_index + 1
     
-    # Vertices
-    V = []
-    for i in range(required_vcount):
-        base = vert_off + i * 12
-        if base + 12 > len(data): break
-        try: x, y, z = struct.unpack_from("<3f", data, base)
-        except: break
-        V.append((x, y, z))
+    # Vertices: (n, 3) float32 view, clipped to the bytes actually present
+    avail = max(0, (len(data) - vert_off) // 12)
+    n = min(required_vcount, avail)
+    V = np.frombuffer(data, dtype='<f4', offset=min(vert_off, len(data)), count=n * 3).reshape(n, 3)
         
     # UVs
     uvs = extract_uvs_from_rrm(data, len(V))
     
-    # Faces
-    faces = []
-    for i in range(0, len(idx_vals), 3):
-        a, b, c = idx_vals[i], idx_vals[i+1], idx_vals[i+2]
-        if a < len(V) and b < len(V) and c < len(V):
-            faces.append((a, b, c))
+    # Faces: keep triangles whose three indices have vertex data
+    faces = idx_vals.reshape(-1, 3)
+    faces = faces[(faces < len(V)).all(axis=1)]
             
     # Deduplicate only if no UVs
     if uvs:
         V_dedup = V
-        map_old_to_new = list(range(len(V)))
+        map_old_to_new = np.arange(len(V))
         uvs_dedup = uvs
     else:
-        # dedup logic
-        eps = 1e-6
-        map_old_to_new = [None] * len(V)
-        V_dedup = []
-        for i, (x, y, z) in enumerate(V):
-            found = False
-            for j, (x2, y2, z2) in enumerate(V_dedup):
-                if abs(x-x2)<eps and abs(y-y2)<eps and abs(z-z2)<eps:
-                    map_old_to_new[i] = j
-                    found = True; break
-            if not found:
-                map_old_to_new[i] = len(V_dedup)
-                V_dedup.append((x, y, z))
+        # dedup logic: quantize to eps and let np.unique group the cells
+        V_dedup, map_old_to_new = dedup_vertices(V)
         uvs_dedup = None
 
     # Texture handling
@@ -253,62 +267,50 @@ def auto_extract_rrm(in_path, out_path):
     mtl_path = os.path.join(out_dir, mtl_filename)
     create_mtl_file(mtl_path, texture_file if texture_file else "")
     
-    # Write OBJ
+    faces_final = map_old_to_new[faces]
+    if not uvs_dedup:
+        # skip degenerate if deduplicated
+        tri = faces_final
+        faces_final = tri[(tri[:, 0] != tri[:, 1]) & (tri[:, 1] != tri[:, 2]) & (tri[:, 0] != tri[:, 2])]
+    
+    # Write OBJ: format each block with a single template, then one write
+    lines = [f"mtllib {mtl_filename}\n", "usemtl material0\n"]
+    lines.append(format_rows("v %.6f %.6f %.6f\n", V_dedup))
+    
+    if uvs_dedup:
+        # Game uses repeat; we just write raw UVs. Non-finite pairs get a
+        # literal "vt 0.0 0.0" line, which consumes no format arguments.
+        uv = np.asarray(uvs_dedup, dtype=np.float64)
+        ok = np.isfinite(uv).all(axis=1)
+        template = "".join(np.where(ok, "vt %.6f %.6f\n", "vt 0.0 0.0\n").tolist())
+        lines.append(template % tuple(uv[ok].ravel().tolist()))
+        lines.append(format_rows("f %d/%d %d/%d %d/%d\n", np.repeat(faces_final + 1, 2, axis=1)))
+    else:
+        lines.append(format_rows("f %d %d %d\n", faces_final + 1))
+    
     with open(out_path, "w", encoding="utf-8") as f:
-        f.write(f"mtllib {mtl_filename}\n")
-        f.write(f"usemtl material0\n")
-        
-        for v in V_dedup:
-            f.write(f"v {v[0]:.6f} {v[1]:.6f} {v[2]:.6f}\n")
-            
-        if uvs_dedup:
-            for u, v in uvs_dedup:
-                # Game uses repeat; we just write raw UVs
-                if not (isfinite(u) and isfinite(v)):
-                    f.write("vt 0.0 0.0\n")
-                else:
-                    f.write(f"vt {u:.6f} {v:.6f}\n")
-                    
-        faces_final = []
-        for a, b, c in faces:
-            na, nb, nc = map_old_to_new[a], map_old_to_new[b], map_old_to_new[c]
-            # skip degenerate if deduplicated
-            if not uvs_dedup and (na == nb or nb == nc or nc == na): continue
-            faces_final.append((na, nb, nc))
-            
-        for a, b, c in faces_final:
-            if uvs_dedup:
-                f.write(f"f {a+1}/{a+1} {b+1}/{b+1} {c+1}/{c+1}\n")
-            else:
-                f.write(f"f {a+1} {b+1} {c+1}\n")
+        f.write("".join(lines))
 
     print(f"Auto-extracted OBJ: {out_path} (verts={len(V_dedup)}, faces={len(faces_final)}, tex={texture_file})")
 
 
 def obj2rrm(in_path, out_path):
-    verts = []
-    # Simple parser for vertices only
-    with open(in_path, "r", encoding="utf-8", errors="ignore") as f:
-        for line in f:
-            if line.startswith("v "):
-                parts = line.strip().split()
-                if len(parts) >= 4:
-                    try:
-                        x = float(parts[1]); y = float(parts[2]); z = float(parts[3])
-                        verts.append((x, y, z))
-                    except Exception: continue
-
-    if not verts:
+    # Simple parser for vertices only: one regex pass over the whole file.
+    # Parsed as float64 and then narrowed, like float() + struct '<f'.
+    with open(in_path, "rb") as f:
+        verts = np.fromregex(f, _OBJ_VERTEX, dtype=[("x", "<f8"), ("y", "<f8"), ("z", "<f8")])
+
+    if verts.size == 0:
         raise RuntimeError("No vertices found in OBJ file")
 
-    # Write RRM
+    # Write RRM: header, count, then all XYZ triples as one float32 block
+    arr = verts.view("<f8").reshape(-1, 3).astype("<f4")
     with open(out_path, "wb") as f:
         f.write(b"RRMEXTR\0")
-        f.write(struct.pack("<I", len(verts)))
-        for v in verts:
-            f.write(struct.pack("<fff", v[0], v[1], v[2]))
+        f.write(_U32.pack(arr.shape[0]))
+        f.write(arr.tobytes())
 
-    print(f"Wrote {len(verts)} vertices to {out_path}")
+    print(f"Wrote {arr.shape[0]} vertices to {out_path}")
     
     # Texture back-conversion (PNG -> DDS)
     in_dir = os.path.dirname(in_path)
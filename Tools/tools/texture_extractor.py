@@ -10,28 +10,49 @@ This tool:
    Each containing: model.obj, model.mtl, texture.png
 """
 
-import os
+import mmap
 import struct
-import sys
 from pathlib import Path
 import shutil
 import argparse
 import re
-import math
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+
+try:
+    from PIL import Image
+except ImportError:  # without Pillow, DDS textures are copied instead of converted
+    Image = None
+
+# Precompiled formats: skip per-call format-string parsing
+_U32 = struct.Struct('<I')
+_OFFSETS = struct.Struct('<2I')  # index/vertex buffer offsets at 0xb0/0xb4
+
+# Separators between a model stem and a texture variant suffix (caha000_alt, caha000-1)
+_VARIANT_SEP = re.compile(r"[_-]")
 
 
 def read_bytes(path):
+    """Map the file read-only so struct/NumPy views alias its pages without copying."""
     with open(path, "rb") as f:
-        return f.read()
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return b""
 
 
-def is_valid_float(v):
-    """Check if a float is reasonable (not denormalized/NaN/Inf)"""
-    return abs(v) < 1e7 and v == v
+def float_runs(arr):
+    """Runs of plausible floats as (start_word, count) arrays, via mask edges."""
+    valid = np.isfinite(arr) & (np.abs(arr) < 1e7)
+    edges = np.flatnonzero(np.diff(np.r_[False, valid, False].astype(np.int8)))
+    return edges[0::2], edges[1::2] - edges[0::2]
 
 
-def extract_uvs_from_rrm(rrm_path, vertex_count):
-    """Extract UV coordinates from RRM file.
+def extract_uvs_from_rrm(data, vertex_count):
+    """Extract UV coordinates from RRM file data (as returned by read_bytes).
     
     RRM format (from header offsets and binary analysis):
     - 0xb0: Index buffer offset
@@ -40,12 +61,10 @@ def extract_uvs_from_rrm(rrm_path, vertex_count):
       Format per stride: [normal data (24 bytes) + uv coordinates (8 bytes)]
       UV coordinates are at bytes 24-32 of each 32-byte stride element
     
-    Returns: list of (u, v) tuples, one per vertex
+    Returns: list of [u, v] pairs, one per vertex
     """
-    data = read_bytes(rrm_path)
-    
     try:
-        vert_off = struct.unpack_from("<I", data, 0xb4)[0]
+        vert_off = _U32.unpack_from(data, 0xb4)[0]
     except struct.error:
         return None
     
@@ -56,44 +75,22 @@ def extract_uvs_from_rrm(rrm_path, vertex_count):
     # Preferred: discover UV streams heuristically (handles alternate layouts).
     def find_uv_run():
         # Find contiguous runs of finite floats
-        runs = []
-        n = len(data)
-        off = 0
-        while off <= n - 4:
-            try:
-                val = struct.unpack_from('<f', data, off)[0]
-            except struct.error:
-                break
-            if not is_valid_float(val):
-                off += 4
-                continue
-            start = off
-            count = 0
-            while off <= n - 4:
-                try:
-                    v = struct.unpack_from('<f', data, off)[0]
-                except struct.error:
-                    break
-                if not is_valid_float(v):
-                    break
-                count += 1
-                off += 4
-            runs.append((start, count))
+        arr = np.frombuffer(data, dtype='<f4', count=len(data) // 4)
+        starts, counts = float_runs(arr)
+        long_enough = counts >= vertex_count * 4
+        starts, counts = starts[long_enough], counts[long_enough]
         
-        candidates = []
-        for start, count in runs:
-            if count >= vertex_count * 4:
-                # Evaluate first 40 floats for range
-                vals = [struct.unpack_from('<f', data, start + i * 4)[0] for i in range(min(count, 40))]
-                rng = max(abs(v) for v in vals)
-                if rng < 5.0:  # UV-ish range
-                    candidates.append((start, count, rng))
+        # Evaluate first 40 floats for range, for every run in one gather
+        # (runs shorter than 40 just repeat their last float)
+        rows = starts[:, None] + np.minimum(np.arange(40), counts[:, None] - 1)
+        rng = np.abs(arr[rows]).max(axis=1)
+        uv_like = rng < 5.0  # UV-ish range
         
         # Pick the closest-to-UV run (lowest range, smallest start)
-        if not candidates:
+        if not uv_like.any():
             return None, None
-        candidates.sort(key=lambda t: (t[2], t[0]))
-        return candidates[0][0], candidates[0][1]
+        best = np.lexsort((starts[uv_like], rng[uv_like]))[0]
+        return int(starts[uv_like][best]) * 4, int(counts[uv_like][best])
     
     # First try legacy known layout at 0x20c0 (normals+uv in stride 32)
     def read_stream2(uv_off):
@@ -103,17 +100,19 @@ def extract_uvs_from_rrm(rrm_path, vertex_count):
             return None
         if uv_off + stride * vertex_count > len(data):
             return None
-        uvs = []
-        for i in range(vertex_count):
-            try:
-                u = struct.unpack_from('<f', data, uv_off + i * stride + uv_offset_in_stride)[0]
-                v = struct.unpack_from('<f', data, uv_off + i * stride + uv_offset_in_stride + 4)[0]
-            except Exception:
-                return None
-            if not (-10.0 < u < 10.0 and -10.0 < v < 10.0):
-                return None
-            uvs.append((u, v))
-        return uvs
+        # One (vertex_count, 8) float view; the UV pair sits at +24 of each element
+        arr = np.frombuffer(data, dtype='<f4', offset=uv_off, count=vertex_count * (stride // 4))
+        uvs = arr.reshape(vertex_count, stride // 4)[:, uv_offset_in_stride // 4:uv_offset_in_stride // 4 + 2]
+        if not ((-10.0 < uvs) & (uvs < 10.0)).all():
+            return None
+        return uvs.tolist()
+    
+    def read_packed(start):
+        # Packed layout: stride 16, 4 floats per vertex, UV in the first two
+        if start + 16 * vertex_count > len(data):
+            return None
+        arr = np.frombuffer(data, dtype='<f4', offset=start, count=vertex_count * 4)
+        return arr.reshape(vertex_count, 4)[:, :2].tolist()
     
     uvs = read_stream2(0x20c0)
     if uvs is None:
@@ -123,30 +122,32 @@ def extract_uvs_from_rrm(rrm_path, vertex_count):
     if uvs is None:
         run_start, _ = find_uv_run()
         if run_start is not None:
-            try:
-                uvs = []
-                for i in range(vertex_count):
-                    u = struct.unpack_from('<f', data, run_start + i * 16)[0]
-                    v = struct.unpack_from('<f', data, run_start + i * 16 + 4)[0]
-                    uvs.append((u, v))
-            except Exception:
-                uvs = None
+            uvs = read_packed(run_start)
     
     # Fallback: try hardcoded alternate start at 0x31c0 (observed secondary UV block)
     if uvs is None:
-        try:
-            uvs = []
-            for i in range(vertex_count):
-                u = struct.unpack_from('<f', data, 0x31c0 + i * 16)[0]
-                v = struct.unpack_from('<f', data, 0x31c0 + i * 16 + 4)[0]
-                uvs.append((u, v))
-        except Exception:
-            uvs = None
+        uvs = read_packed(0x31c0)
     
     return uvs
 
 
-def find_dds_variants(base_name):
+def build_dds_index(cacc_dir):
+    """Index every DDS in cacc_dir by each model stem it can belong to.
+    
+    One directory scan replaces three globs per model: "caha000_alt.dds" is
+    filed under both "caha000_alt" and "caha000". Each list keeps the old
+    glob order: exact match, then "_" variants, then "-" variants.
+    """
+    index = defaultdict(list)
+    for p in cacc_dir.glob("*.dds"):
+        name = p.stem
+        index[name].append((0, p))
+        for sep in _VARIANT_SEP.finditer(name):
+            index[name[:sep.start()]].append((1 if sep.group() == "_" else 2, p))
+    return {stem: [p for _, p in sorted(entries)] for stem, entries in index.items()}
+
+
+def find_dds_variants(base_name, dds_index=None):
     """Find DDS textures for a given model.
     
     Faithful rule: only make variants when there are multiple DDS files that
@@ -155,46 +156,23 @@ def find_dds_variants(base_name):
       - caha000.dds, caha000_alt.dds, caha000_v2.dds
       - caha000.dds, caha000-1.dds, caha000-2.dds
     If only one DDS is found for the stem, no variants are created.
+    
+    Pass the result of build_dds_index() when looking up many models;
+    otherwise the cacc directory is scanned for this call.
     """
-    script_dir = Path(__file__).resolve().parent
-    repo_dir = script_dir.parent
-    cacc_dir = repo_dir / "cacc"
-
-    stem = base_name
-    patterns = [
-        f"{stem}.dds",
-        f"{stem}_*.dds",
-        f"{stem}-*.dds",
-    ]
-
-    candidates = []
-    for pat in patterns:
-        candidates.extend(sorted(cacc_dir.glob(pat)))
-
-    # Deduplicate while preserving order
-    seen = set()
-    variants = []
-    for p in candidates:
-        if p not in seen:
-            variants.append(p)
-            seen.add(p)
-
-    return variants
+    if dds_index is None:
+        script_dir = Path(__file__).resolve().parent
+        repo_dir = script_dir.parent
+        dds_index = build_dds_index(repo_dir / "cacc")
+    return dds_index.get(base_name, [])
 
 
 def dds_to_png(dds_path, output_path, model_name="texture"):
     """Convert DDS to PNG; fallback to copying DDS if conversion fails."""
     png_path = output_path / f"{model_name}.png"
-    try:
-        from PIL import Image
-    except ImportError:
-        Image = None
-        try:
-            import subprocess
-            subprocess.run([sys.executable, "-m", "pip", "install", "pillow", "-q"], check=False, timeout=30)
-            from PIL import Image  # type: ignore
-        except Exception:
-            Image = None
+    # Already converted by an earlier run and still current: skip the re-encode
+    if png_path.exists() and png_path.stat().st_mtime >= dds_path.stat().st_mtime:
+        return f"{model_name}.png"
     if Image is not None:
         try:
             with Image.open(dds_path) as img:
@@ -230,6 +208,41 @@ illum 1"""
     mtl_path.write_text(mtl_content)
 
 
+def dedup_vertices(V, eps=1e-6):
+    """Merge positions that fall in the same eps grid cell.
+    
+    Returns (V_dedup, remap): unique rows of V in first-occurrence order and,
+    per input row, its index into V_dedup. Non-finite rows are never merged.
+    """
+    with np.errstate(invalid="ignore", over="ignore"):
+        V64 = np.asarray(V, dtype=np.float64)  # signalling NaNs warn on the cast
+        q = np.round(V64 / eps)
+    small = np.abs(q) < 2.0**62  # False for NaN/inf and values too big for int64
+    # Quantized cells where they fit, raw float bits (exact match) otherwise,
+    # plus a column recording which coordinates hold bits
+    bits = np.ascontiguousarray(V, dtype="<f4").view("<i4")
+    keys = np.empty((len(V64), 4), dtype=np.int64)
+    cells = keys[:, :3]
+    cells[:] = bits
+    cells[small] = q[small]
+    keys[:, 3] = (~small) @ np.array([1, 2, 4])
+    nonfinite = np.flatnonzero(~np.isfinite(V64).all(axis=1))
+    keys[nonfinite, 3] = -1 - nonfinite
+    
+    _, first, inv = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    # np.unique sorts by key; renumber groups by first occurrence instead
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return V[first[order]], rank[inv.reshape(-1)]
+
+
+def format_rows(template, rows):
+    """Format every row of a 2D array with one %-operation on a repeated template."""
+    rows = np.asarray(rows)
+    return (template * len(rows)) % tuple(rows.ravel().tolist())
+
+
 def extract_rrm_to_obj_with_uvs(rrm_path, obj_path, mtl_name="model.mtl"):
     """Extract RRM to OBJ with UV coordinates.
     
@@ -242,131 +255,179 @@ def extract_rrm_to_obj_with_uvs(rrm_path, obj_path, mtl_name="model.mtl"):
     
     # Read header offsets
     try:
-        idx_off = struct.unpack_from("<I", data, 0xb0)[0]
-        vert_off = struct.unpack_from("<I", data, 0xb4)[0]
+        idx_off, vert_off = _OFFSETS.unpack_from(data, 0xb0)
     except struct.error:
         raise RuntimeError("Failed to read header offsets (0xb0/0xb4)")
     
-    # Read indices
-    idx_vals = []
-    off = idx_off
-    while off < len(data) - 3:
-        try:
-            val = struct.unpack_from("<I", data, off)[0]
-            if val > 100000:
-                break
-            idx_vals.append(val)
-            off += 4
-        except struct.error:
-            break
+    # Read indices: view the rest of the file as uint32 and stop at the
+    # first value above 100000 (end-of-buffer heuristic)
+    n_words = max(0, (len(data) - idx_off) // 4)
+    idx = np.frombuffer(data, dtype='<u4', offset=min(idx_off, len(data)), count=n_words)
+    bad = idx > 100000
+    cutoff = int(bad.argmax()) if bad.any() else idx.size
     
     # Ensure divisible by 3
-    if len(idx_vals) % 3 != 0:
-        idx_vals = idx_vals[:((len(idx_vals) // 3) * 3)]
+    idx_vals = idx[:cutoff - (cutoff % 3)]
     
-    if not idx_vals:
+    if idx_vals.size == 0:
         raise RuntimeError("No index data found")
     
-    max_index = max(idx_vals) if idx_vals else 0
+    max_index = int(idx_vals.max())
     required_vcount = max_index + 1
     
-    # Read vertices using fixed stride (12 bytes per vertex) based on required_vcount
-    V = []
-    for i in range(required_vcount):
-        base = vert_off + i * 12
-        if base + 12 > len(data):
-            break
-        try:
-            x, y, z = struct.unpack_from("<3f", data, base)
-        except struct.error:
-            break
-        V.append((x, y, z))
+    # Read vertices using fixed stride (12 bytes per vertex) based on required_vcount,
+    # as a single (n, 3) float32 view clipped to the bytes actually present
+    avail = max(0, (len(data) - vert_off) // 12)
+    n = min(required_vcount, avail)
+    V = np.frombuffer(data, dtype='<f4', offset=min(vert_off, len(data)), count=n * 3).reshape(n, 3)
     
     # Extract UVs
-    uvs = extract_uvs_from_rrm(rrm_path, len(V))
+    uvs = extract_uvs_from_rrm(data, len(V))
     
     # Build faces
-    faces = []
-    for i in range(0, len(idx_vals), 3):
-        a, b, c = idx_vals[i], idx_vals[i+1], idx_vals[i+2]
-        if a >= len(V) or b >= len(V) or c >= len(V):
-            continue
-        faces.append((a, b, c))
+    faces = idx_vals.reshape(-1, 3)
+    faces = faces[(faces < len(V)).all(axis=1)]
     
     # Deduplicate vertices (epsilon-based) — but only when we lack UVs.
     # When UVs exist, positions can share XYZ but differ in UV; keep them separate.
     if uvs:
-        V_dedup = V[:]  # preserve 1:1 mapping to keep unique UVs per vertex
-        map_old_to_new = list(range(len(V)))
+        V_dedup = V  # preserve 1:1 mapping to keep unique UVs per vertex
+        map_old_to_new = np.arange(len(V))
     else:
-        eps = 1e-6
-        map_old_to_new = [None] * len(V)
-        V_dedup = []
-        
-        for i, (x, y, z) in enumerate(V):
-            found = False
-            for j, (x2, y2, z2) in enumerate(V_dedup):
-                if abs(x - x2) < eps and abs(y - y2) < eps and abs(z - z2) < eps:
-                    map_old_to_new[i] = j
-                    found = True
-                    break
-            
-            if not found:
-                map_old_to_new[i] = len(V_dedup)
-                V_dedup.append((x, y, z))
+        V_dedup, map_old_to_new = dedup_vertices(V)
     
     # Remap faces and build final OBJ
-    faces_final = []
-    for a, b, c in faces:
-        a_new = map_old_to_new[a]
-        b_new = map_old_to_new[b]
-        c_new = map_old_to_new[c]
-        if a_new != b_new and b_new != c_new and c_new != a_new:  # non-degenerate
-            faces_final.append((a_new, b_new, c_new))
+    f = map_old_to_new[faces]
+    non_degenerate = (f[:, 0] != f[:, 1]) & (f[:, 1] != f[:, 2]) & (f[:, 0] != f[:, 2])
+    faces_final = f[non_degenerate]
     
     # Write OBJ with MTL reference
     obj_lines = [f"mtllib {mtl_name}\n", "usemtl material0\n"]
     
     # Vertices
-    for x, y, z in V_dedup:
-        obj_lines.append(f"v {x:.6f} {y:.6f} {z:.6f}\n")
+    obj_lines.append(format_rows("v %.6f %.6f %.6f\n", V_dedup))
     
     # Texture coordinates (if we have them)
     if uvs:
-        # Map UVs to deduplicated vertices
-        uvs_dedup = [None] * len(V_dedup)
-        for old_i, new_i in enumerate(map_old_to_new):
-            if old_i < len(uvs):
-                uvs_dedup[new_i] = uvs[old_i]
+        # Map UVs to deduplicated vertices; unmapped or non-finite ones become (0, 0)
+        uvs_dedup = np.zeros((len(V_dedup), 2))
+        n = min(len(uvs), len(map_old_to_new))
+        uvs_dedup[map_old_to_new[:n]] = uvs[:n]
         
         # Write raw UVs; the game relies on sampler repeat rather than pre-wrapping
-        for i, uv in enumerate(uvs_dedup):
-            if uv is None:
-                uvs_dedup[i] = (0.0, 0.0)
-            else:
-                u, v = uv
-                if not (math.isfinite(u) and math.isfinite(v)):
-                    uvs_dedup[i] = (0.0, 0.0)
-                else:
-                    uvs_dedup[i] = (u, v)
-
-        # Write texture coordinates
-        for u, v in uvs_dedup:
-            obj_lines.append(f"vt {u:.6f} {v:.6f}\n")
+        uvs_dedup[~np.isfinite(uvs_dedup).all(axis=1)] = 0.0
+        obj_lines.append(format_rows("vt %.6f %.6f\n", uvs_dedup))
     
     # Faces with texture indices
-    for a, b, c in faces_final:
-        if uvs:
-            # v/vt format (vertex/texture)
-            obj_lines.append(f"f {a+1}/{a+1} {b+1}/{b+1} {c+1}/{c+1}\n")
-        else:
-            # v format only
-            obj_lines.append(f"f {a+1} {b+1} {c+1}\n")
+    if uvs:
+        # v/vt format (vertex/texture)
+        obj_lines.append(format_rows("f %d/%d %d/%d %d/%d\n", np.repeat(faces_final + 1, 2, axis=1)))
+    else:
+        # v format only
+        obj_lines.append(format_rows("f %d %d %d\n", faces_final + 1))
     
     obj_path.write_text("".join(obj_lines))
     return len(V_dedup), len(faces_final)
 
 
+def process_rrm(rrm_path, dds_variants, output_dir):
+    """Extract one RRM model (and its texture variants) into output_dir.
+    
+    Runs in a worker process, so it reports back instead of printing:
+    returns (stats_delta, log_lines) for organize_models to merge.
+    """
+    base_name = rrm_path.stem
+    stats = {"success": 0, "error": 0, "multi": 0, "single": 0}
+    log = []
+    
+    if not dds_variants:
+        # No textures, just extract model
+        model_dir = output_dir / base_name
+        model_dir.mkdir(parents=True, exist_ok=True)
+        
+        try:
+            obj_path = model_dir / f"{base_name}.obj"
+            mtl_path = model_dir / f"{base_name}.mtl"
+            
+            vcount, fcount = extract_rrm_to_obj_with_uvs(
+                str(rrm_path), obj_path, f"{base_name}.mtl"
+            )
+            create_mtl_file(mtl_path, "")
+            
+            shutil.copy(rrm_path, model_dir / rrm_path.name)
+            
+            log.append(f"✓ {base_name:20s}: {vcount:4d} verts, {fcount:3d} faces (no texture)")
+            stats["success"] += 1
+            stats["single"] += 1
+        except Exception as e:
+            log.append(f"✗ {base_name:20s}: {e}")
+            stats["error"] += 1
+    
+    elif len(dds_variants) == 1:
+        # Single variant
+        model_dir = output_dir / base_name
+        model_dir.mkdir(parents=True, exist_ok=True)
+        
+        try:
+            obj_path = model_dir / f"{base_name}.obj"
+            mtl_path = model_dir / f"{base_name}.mtl"
+            
+            vcount, fcount = extract_rrm_to_obj_with_uvs(
+                str(rrm_path), obj_path, f"{base_name}.mtl"
+            )
+            
+            # Convert/copy texture, naming it after the DDS variant
+            dds_path = dds_variants[0]
+            dds_base_name = dds_path.stem
+            texture_filename = dds_to_png(dds_path, model_dir, dds_base_name)
+            
+            create_mtl_file(mtl_path, texture_filename)
+            shutil.copy(rrm_path, model_dir / rrm_path.name)
+            
+            log.append(f"✓ {base_name:20s}: {vcount:4d} verts, {fcount:3d} faces ({texture_filename})")
+            stats["success"] += 1
+            stats["single"] += 1
+        except Exception as e:
+            log.append(f"✗ {base_name:20s}: {e}")
+            stats["error"] += 1
+    
+    else:
+        # Multiple variants - create subfolders
+        model_base_dir = output_dir / base_name
+        
+        for variant_idx, dds_path in enumerate(dds_variants):
+            variant_name = dds_path.stem  # e.g., "caha000" from caha000.dds
+            variant_dir = model_base_dir / f"variant_{variant_idx}"
+            variant_dir.mkdir(parents=True, exist_ok=True)
+            
+            try:
+                obj_path = variant_dir / f"{variant_name}.obj"
+                mtl_path = variant_dir / f"{variant_name}.mtl"
+                
+                vcount, fcount = extract_rrm_to_obj_with_uvs(
+                    str(rrm_path), obj_path, f"{variant_name}.mtl"
+                )
+                
+                # Convert/copy texture with the DDS variant name
+                texture_filename = dds_to_png(dds_path, variant_dir, variant_name)
+                
+                create_mtl_file(mtl_path, texture_filename)
+                
+                if variant_idx == 0:  # Only copy RRM once
+                    shutil.copy(rrm_path, variant_dir / rrm_path.name)
+                
+            except Exception as e:
+                log.append(f"  ✗ {variant_name}: {e}")
+                stats["error"] += 1
+                continue
+        
+        log.append(f"✓ {base_name:20s}: {len(dds_variants)} variants with textures")
+        stats["success"] += 1
+        stats["multi"] += 1
+    
+    return stats, log
+
+
 def organize_models():
     """Main function: Extract all RRM models and organize with textures."""
     
@@ -386,94 +447,17 @@ def organize_models():
     
     stats = {"success": 0, "error": 0, "multi": 0, "single": 0}
     
-    for rrm_path in rrm_files:
-        base_name = rrm_path.stem
-        dds_variants = find_dds_variants(base_name)
-        
-        if not dds_variants:
-            # No textures, just extract model
-            model_dir = output_dir / base_name
-            model_dir.mkdir(parents=True, exist_ok=True)
-            
-            try:
-                obj_path = model_dir / f"{base_name}.obj"
-                mtl_path = model_dir / f"{base_name}.mtl"
-                
-                vcount, fcount = extract_rrm_to_obj_with_uvs(
-                    str(rrm_path), obj_path, f"{base_name}.mtl"
-                )
-                create_mtl_file(mtl_path, "")
-                
-                shutil.copy(rrm_path, model_dir / rrm_path.name)
-                
-                print(f"✓ {base_name:20s}: {vcount:4d} verts, {fcount:3d} faces (no texture)")
-                stats["success"] += 1
-                stats["single"] += 1
-            except Exception as e:
-                print(f"✗ {base_name:20s}: {e}")
-                stats["error"] += 1
-        
-        elif len(dds_variants) == 1:
-            # Single variant
-            model_dir = output_dir / base_name
-            model_dir.mkdir(parents=True, exist_ok=True)
-            
-            try:
-                obj_path = model_dir / f"{base_name}.obj"
-                mtl_path = model_dir / f"{base_name}.mtl"
-                
-                vcount, fcount = extract_rrm_to_obj_with_uvs(
-                    str(rrm_path), obj_path, f"{base_name}.mtl"
-                )
-                
-                # Convert/copy texture, naming it after the DDS variant
-                dds_path = dds_variants[0]
-                dds_base_name = dds_path.stem
-                texture_filename = dds_to_png(dds_path, model_dir, dds_base_name)
-                
-                create_mtl_file(mtl_path, texture_filename)
-                shutil.copy(rrm_path, model_dir / rrm_path.name)
-                
-                print(f"✓ {base_name:20s}: {vcount:4d} verts, {fcount:3d} faces ({texture_filename})")
-                stats["success"] += 1
-                stats["single"] += 1
-            except Exception as e:
-                print(f"✗ {base_name:20s}: {e}")
-                stats["error"] += 1
-        
-        else:
-            # Multiple variants - create subfolders
-            model_base_dir = output_dir / base_name
-            
-            for variant_idx, dds_path in enumerate(dds_variants):
-                variant_name = dds_path.stem  # e.g., "caha000" from caha000.dds
-                variant_dir = model_base_dir / f"variant_{variant_idx}"
-                variant_dir.mkdir(parents=True, exist_ok=True)
-                
-                try:
-                    obj_path = variant_dir / f"{variant_name}.obj"
-                    mtl_path = variant_dir / f"{variant_name}.mtl"
-                    
-                    vcount, fcount = extract_rrm_to_obj_with_uvs(
-                        str(rrm_path), obj_path, f"{variant_name}.mtl"
-                    )
-                    
-                    # Convert/copy texture with the DDS variant name
-                    texture_filename = dds_to_png(dds_path, variant_dir, variant_name)
-                    
-                    create_mtl_file(mtl_path, texture_filename)
-                    
-                    if variant_idx == 0:  # Only copy RRM once
-                        shutil.copy(rrm_path, variant_dir / rrm_path.name)
-                    
-                except Exception as e:
-                    print(f"  ✗ {variant_name}: {e}")
-                    stats["error"] += 1
-                    continue
-            
-            print(f"✓ {base_name:20s}: {len(dds_variants)} variants with textures")
-            stats["success"] += 1
-            stats["multi"] += 1
+    dds_index = build_dds_index(cacc_dir)
+    dds_variants = [find_dds_variants(p.stem, dds_index) for p in rrm_files]
+    
+    # Models are independent, so fan them out across CPUs; map() yields
+    # results in submission order, which keeps the log sorted by name.
+    with ProcessPoolExecutor() as pool:
+        for file_stats, log in pool.map(process_rrm, rrm_files, dds_variants, repeat(output_dir)):
+            for line in log:
+                print(line)
+            for key, count in file_stats.items():
+                stats[key] += count
     
     print(f"\n{'='*60}")
     print(f"Success: {stats['success']}, Errors: {stats['error']}")
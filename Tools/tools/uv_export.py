@@ -11,48 +11,71 @@ Exports three OBJ/MTL pairs (if available):
 All reference the same DDS (if found) via map_Kd and copy the DDS beside outputs.
 """
 import argparse
+import mmap
+import os
 import struct
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import shutil
 
+import numpy as np
+
+_OFFSETS = struct.Struct('<2I')  # index/vertex buffer offsets at 0xB0/0xB4
+
+
+def read_bytes(path: Path):
+    # read-only mapping: struct/NumPy views alias its pages without copying
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return b""
+    # every region (header, indices, vertices, UV blocks) is read once: prefetch
+    if hasattr(mmap, 'MADV_WILLNEED'):  # not on Windows
+        mm.madvise(mmap.MADV_WILLNEED)
+    return mm
+
 
 def read_vertices(data: bytes, vert_off: int, count: int):
-    verts = []
-    for i in range(count):
-        base = vert_off + i * 12
-        if base + 12 > len(data):
-            break
-        verts.append(struct.unpack_from('<3f', data, base))
-    return verts
+    # (count, 3) float32 view, clamped to the vertices actually present
+    count = min(count, max(0, (len(data) - vert_off) // 12))
+    return np.frombuffer(data, dtype='<f4', count=count * 3, offset=min(vert_off, len(data))).reshape(-1, 3)
+
+
+def index_end(arr) -> int:
+    # heuristic end: first value > 100000, or the whole tail if none
+    over = arr > 100000
+    return int(over.argmax()) if over.any() else len(arr)
 
 
 def read_indices(data: bytes, idx_off: int):
-    vals = []
-    off = idx_off
-    while off + 4 <= len(data):
-        v = struct.unpack_from('<I', data, off)[0]
-        if v > 100000:  # heuristic end
-            break
-        vals.append(v)
-        off += 4
+    arr = np.frombuffer(data, dtype='<u4', count=max(0, (len(data) - idx_off) // 4), offset=min(idx_off, len(data)))
+    end = index_end(arr)
     # trim to triangles
-    tri_len = (len(vals) // 3) * 3
-    return vals[:tri_len]
+    return arr[:end - end % 3]
+
 
+def format_rows(template: bytes, rows) -> bytes:
+    # one %-operation over a template repeated per row
+    rows = np.asarray(rows)
+    return (template * len(rows)) % tuple(rows.ravel().tolist())
 
-def write_obj(path: Path, verts, uvs, faces, mtl_name: str):
-    lines = [f"mtllib {mtl_name}\n", "usemtl material0\n"]
-    for x, y, z in verts:
-        lines.append(f"v {x:.6f} {y:.6f} {z:.6f}\n")
-    if uvs:
-        for u, v in uvs:
-            lines.append(f"vt {u:.6f} {v:.6f}\n")
-    for a, b, c in faces:
-        if uvs:
-            lines.append(f"f {a+1}/{a+1} {b+1}/{b+1} {c+1}/{c+1}\n")
-        else:
-            lines.append(f"f {a+1} {b+1} {c+1}\n")
-    path.write_text("".join(lines))
+
+def obj_blocks(verts, faces) -> tuple[bytes, bytes]:
+    # vertex and v/vt face blocks are identical for every UV variant
+    v_block = format_rows(b"v %.6f %.6f %.6f\n", verts)
+    # each corner is written as i/i, so repeat every index column in place
+    f_block = format_rows(b"f %d/%d %d/%d %d/%d\n", np.repeat(faces + 1, 2, axis=1))
+    return v_block, f_block
+
+
+def write_obj(path: Path, v_block: bytes, uvs, f_block: bytes, mtl_name: str):
+    header = b"mtllib %s\nusemtl material0\n" % mtl_name.encode()
+    vt_block = format_rows(b"vt %.6f %.6f\n", uvs)
+    with open(path, 'wb', buffering=1 << 20) as f:
+        f.writelines((header, v_block, vt_block, f_block))
 
 
 def write_mtl(path: Path, texture_name: str | None):
@@ -75,39 +98,57 @@ def extract_uv_stream2(data: bytes, vertex_count: int):
     off_in = 24
     if uv_off + stride * vertex_count > len(data):
         return None
-    uvs = []
-    for i in range(vertex_count):
-        u = struct.unpack_from('<f', data, uv_off + i * stride + off_in)[0]
-        v = struct.unpack_from('<f', data, uv_off + i * stride + off_in + 4)[0]
-        uvs.append((u, v))
-    return uvs
+    # (vertex_count, 8) float view; the UV pair is the two floats at +24
+    arr = np.frombuffer(data, dtype='<f4', count=vertex_count * (stride // 4), offset=uv_off)
+    return arr.reshape(vertex_count, stride // 4)[:, off_in // 4:off_in // 4 + 2]
 
 
 def extract_uv_packed(data: bytes, vertex_count: int, set_idx: int):
     # set_idx 0 uses floats 0-1, set_idx 1 uses floats 2-3
     start = 0x31C0
     stride = 16
-    off_u = 0 if set_idx == 0 else 8
-    off_v = 4 if set_idx == 0 else 12
+    col = 0 if set_idx == 0 else 2
     if start + stride * vertex_count > len(data):
         return None
-    uvs = []
-    for i in range(vertex_count):
-        u = struct.unpack_from('<f', data, start + i * stride + off_u)[0]
-        v = struct.unpack_from('<f', data, start + i * stride + off_v)[0]
-        uvs.append((u, v))
-    return uvs
+    arr = np.frombuffer(data, dtype='<f4', count=vertex_count * (stride // 4), offset=start)
+    return arr.reshape(vertex_count, stride // 4)[:, col:col + 2]
+
+
+@lru_cache(maxsize=None)
+def dds_listing(cacc_dir: Path) -> tuple[str, ...]:
+    # one scandir per directory; sorted so prefix matches come out in glob order
+    try:
+        with os.scandir(cacc_dir) as it:
+            return tuple(sorted(e.name for e in it if e.name.endswith('.dds') and e.is_file()))
+    except FileNotFoundError:
+        return ()
 
 
 def find_dds(base_stem: str):
     cacc_dir = Path(__file__).resolve().parent.parent / 'cacc'
+    names = dds_listing(cacc_dir)
     # Prefer exact stem.dds
-    exact = cacc_dir / f"{base_stem}.dds"
-    if exact.exists():
-        return exact
-    # Fallback: any matching prefix
-    matches = sorted(cacc_dir.glob(f"{base_stem}*.dds"))
-    return matches[0] if matches else None
+    exact = f"{base_stem}.dds"
+    i = bisect_left(names, exact)
+    if i < len(names) and names[i] == exact:
+        return cacc_dir / exact
+    # Fallback: first name (sorted) with a matching prefix
+    i = bisect_left(names, base_stem)
+    if i < len(names) and names[i].startswith(base_stem):
+        return cacc_dir / names[i]
+    return None
+
+
+def copy_texture(src: Path, dst: Path):
+    # copy2 already copies in-kernel (sendfile) on Linux; the win is skipping
+    # textures left in place, unchanged, by an earlier export
+    try:
+        st, dt = src.stat(), dst.stat()
+        if dt.st_size == st.st_size and dt.st_mtime >= st.st_mtime:
+            return
+    except FileNotFoundError:
+        pass
+    shutil.copy2(src, dst)
 
 
 def main():
@@ -120,18 +161,21 @@ def main():
     out_dir = Path(args.out)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    data = rrm_path.read_bytes()
-    idx_off = struct.unpack_from('<I', data, 0xB0)[0]
-    vert_off = struct.unpack_from('<I', data, 0xB4)[0]
+    # memoryview: any slicing in the readers stays a zero-copy view of the mapping
+    data = memoryview(read_bytes(rrm_path))
+    # validate the header once up front; the readers below then only clamp
+    if len(data) < 0xB0 + _OFFSETS.size:
+        raise SystemExit("File too small for RRM header")
+    idx_off, vert_off = _OFFSETS.unpack_from(data, 0xB0)
 
     idx_vals = read_indices(data, idx_off)
-    if not idx_vals:
+    if not len(idx_vals):
         raise SystemExit("No indices found")
-    max_idx = max(idx_vals)
+    max_idx = int(idx_vals.max())
     vcount = max_idx + 1
 
     verts = read_vertices(data, vert_off, vcount)
-    faces = [(idx_vals[i], idx_vals[i+1], idx_vals[i+2]) for i in range(0, len(idx_vals), 3)]
+    faces = idx_vals.reshape(-1, 3)
 
     # UV sets
     uv_stream2 = extract_uv_stream2(data, vcount)
@@ -143,7 +187,9 @@ def main():
     tex_name = None
     if dds:
         tex_name = dds.name
-        shutil.copy2(dds, out_dir / dds.name)
+        copy_texture(dds, out_dir / dds.name)
+
+    v_block, f_block = obj_blocks(verts, faces)
 
     # Export each available UV set
     variants = [
@@ -151,14 +197,18 @@ def main():
         ("uv0", uv0),
         ("uv1", uv1),
     ]
-    for label, uvset in variants:
-        if uvset is None:
-            continue
+    def export(label, uvset):
         obj_name = f"{stem}_{label}.obj"
         mtl_name = f"{stem}_{label}.mtl"
-        write_obj(out_dir / obj_name, verts, uvset, faces, mtl_name)
+        write_obj(out_dir / obj_name, v_block, uvset, f_block, mtl_name)
         write_mtl(out_dir / mtl_name, tex_name)
 
+    # variants are independent; file writes release the GIL so threads overlap them
+    with ThreadPoolExecutor(max_workers=len(variants)) as pool:
+        futures = [pool.submit(export, label, uvset) for label, uvset in variants if uvset is not None]
+        for fut in futures:
+            fut.result()
+
     print("Exported variants to", out_dir)
 
 